@@ -24,37 +24,41 @@ function showSettingsSection(section) {
     }
 }
 
+// Section generators, resolved once. Providers is already rendered in HTML.
+const SETTINGS_SECTION_GENERATORS = {
+    general: generateGeneralSettings,
+    payments: generatePaymentSettings,
+    modules: generateModuleSettings,
+    integrations: generateIntegrationSettings,
+    notifications: generateNotificationSettings,
+    bonuses: generateBonusSettings,
+    signup: generateSignupSettings,
+    ticket: generateTicketSettings
+};
+
 // Load settings section dynamically
 function loadSettingsSection(section) {
+    const generateSection = SETTINGS_SECTION_GENERATORS[section];
+    if (!generateSection) {
+        return;
+    }
+
     const container = document.querySelector('.settings-content');
-    const sections = {
-        general: generateGeneralSettings(),
-        providers: '', // Already in HTML
-        payments: generatePaymentSettings(),
-        modules: generateModuleSettings(),
-        integrations: generateIntegrationSettings(),
-        notifications: generateNotificationSettings(),
-        bonuses: generateBonusSettings(),
-        signup: generateSignupSettings(),
-        ticket: generateTicketSettings()
-    };
+
+    // Hide providers section
+    const providersSection = document.getElementById('providers-section');
+    if (providersSection) providersSection.style.display = 'none';
     
-    if (sections[section]) {
-        // Hide providers section
-        const providersSection = document.getElementById('providers-section');
-        if (providersSection) providersSection.style.display = 'none';
-        
-        // Add new section if it doesn't exist
-        let sectionEl = document.getElementById(`${section}-section`);
-        if (!sectionEl) {
-            sectionEl = document.createElement('div');
-            sectionEl.id = `${section}-section`;
-            sectionEl.className = 'settings-section';
-            sectionEl.innerHTML = sections[section];
-            container.appendChild(sectionEl);
-        }
-        sectionEl.style.display = 'block';
+    // Add new section if it doesn't exist
+    let sectionEl = document.getElementById(`${section}-section`);
+    if (!sectionEl) {
+        sectionEl = document.createElement('div');
+        sectionEl.id = `${section}-section`;
+        sectionEl.className = 'settings-section';
+        sectionEl.innerHTML = generateSection();
+        container.appendChild(sectionEl);
     }
+    sectionEl.style.display = 'block';
 }
 
 // Generate General Settings HTML
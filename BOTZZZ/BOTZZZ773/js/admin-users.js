@@ -82,7 +82,7 @@ async function populateUsersTable() {
             `;
         }).join('');
         
-        console.log(`✅ Loaded ${usersData.length} users from database`);
+        console.log('✅ Loaded users from database:', usersData.length);
         
     } catch (error) {
         console.error('Error fetching users:', error);
@@ -331,9 +331,12 @@ function sortTable(column) {
     
     sortDirection[column] = !sortDirection[column];
     
+    // Look up the column once rather than re-querying the headers per comparison
+    const columnIndex = getColumnIndex(column);
+    
     rows.sort((a, b) => {
-        const aText = a.cells[getColumnIndex(column)].textContent;
-        const bText = b.cells[getColumnIndex(column)].textContent;
+        const aText = a.cells[columnIndex].textContent;
+        const bText = b.cells[columnIndex].textContent;
         
         const aValue = isNaN(aText) ? aText : parseFloat(aText);
         const bValue = isNaN(bText) ? bText : parseFloat(bText);
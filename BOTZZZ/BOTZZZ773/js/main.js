@@ -110,9 +110,10 @@ const animateElements = document.querySelectorAll('.step-card, .service-card, .f
 animateElements.forEach(el => observer.observe(el));
 
 // Form Validation Helper
+const EMAIL_PATTERN = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
 function validateEmail(email) {
-    const re = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-    return re.test(String(email).toLowerCase());
+    return EMAIL_PATTERN.test(String(email).toLowerCase());
 }
 
 function validateURL(url) {
@@ -1,10 +1,24 @@
 // Authentication API - Signup, Login, Logout, Token Verification
-const { supabase, supabaseAdmin } = require('./utils/supabase');
+const { supabaseAdmin } = require('./utils/supabase');
 const bcrypt = require('bcryptjs');
 const jwt = require('jsonwebtoken');
 
 const JWT_SECRET = process.env.JWT_SECRET;
-const SALT_ROUNDS = 10;
+// bcrypt cost for new password hashes. Only local `netlify dev` runs (which
+// the test suites use) may override it, with a cost bcrypt accepts (4-31);
+// everywhere else, and for any other value, the default applies.
+const DEFAULT_SALT_ROUNDS = 10;
+const configuredSaltRounds = Number(process.env.BCRYPT_SALT_ROUNDS);
+const SALT_ROUNDS = process.env.NETLIFY_DEV === 'true'
+  && Number.isInteger(configuredSaltRounds)
+  && configuredSaltRounds >= 4
+  && configuredSaltRounds <= 31
+  ? configuredSaltRounds
+  : DEFAULT_SALT_ROUNDS;
+
+if (SALT_ROUNDS < DEFAULT_SALT_ROUNDS) {
+  console.warn('⚠️ Using a reduced bcrypt cost for local testing:', SALT_ROUNDS);
+}
 
 // Helper function to create JWT token
 function createToken(user) {
@@ -542,7 +556,6 @@ async function handleGoogleSignIn(data, headers) {
 
       if (createError) {
         console.error('Create Google user error:', createError);
-        console.error('Error details:', JSON.stringify(createError, null, 2));
         return {
           statusCode: 500,
           headers,
@@ -578,7 +591,6 @@ async function handleGoogleSignIn(data, headers) {
     };
   } catch (error) {
     console.error('Google sign-in error:', error);
-    console.error('Error stack:', error.stack);
     return {
       statusCode: 500,
       headers,
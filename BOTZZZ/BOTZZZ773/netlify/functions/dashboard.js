@@ -157,20 +157,14 @@ async function handleUserStats(user, headers) {
       .eq('id', user.userId)
       .single();
 
-    // Get user's total spent
-    const { data: orders } = await supabaseAdmin
+    // Get user's total spent and order count from the same query
+    const { data: orders, count: orderCount } = await supabaseAdmin
       .from('orders')
-      .select('charge')
+      .select('charge', { count: 'exact' })
       .eq('user_id', user.userId);
 
     const totalSpent = orders?.reduce((sum, o) => sum + parseFloat(o.charge), 0) || 0;
 
-    // Get user's order count
-    const { count: orderCount } = await supabaseAdmin
-      .from('orders')
-      .select('*', { count: 'exact', head: true })
-      .eq('user_id', user.userId);
-
     // Get user's open tickets
     const { count: openTickets } = await supabaseAdmin
       .from('tickets')
@@ -1,10 +1,14 @@
 // Orders API - Create, Get, Update, Cancel Orders
 const { supabase, supabaseAdmin } = require('./utils/supabase');
 const jwt = require('jsonwebtoken');
-const axios = require('axios');
 
 const JWT_SECRET = process.env.JWT_SECRET;
 
+// Lazy-load axios; listing orders never calls out to a provider
+function getHttpClient() {
+  return require('axios');
+}
+
 function getUserFromToken(authHeader) {
   if (!authHeader || !authHeader.startsWith('Bearer ')) {
     return null;
@@ -329,7 +333,7 @@ async function handleUpdateOrder(user, data, headers) {
       // Submit refill request to provider
       try {
         const provider = order.service.provider;
-        const refillResponse = await axios.post(provider.api_url, {
+        const refillResponse = await getHttpClient().post(provider.api_url, {
           key: provider.api_key,
           action: 'refill',
           order: order.provider_order_id
@@ -426,7 +430,7 @@ async function handleCancelOrder(user, data, headers) {
     // Try to cancel with provider
     try {
       const provider = order.service.provider;
-      await axios.post(provider.api_url, {
+      await getHttpClient().post(provider.api_url, {
         key: provider.api_key,
         action: 'cancel',
         order: order.provider_order_id
@@ -476,7 +480,7 @@ async function handleCancelOrder(user, data, headers) {
 
 async function submitOrderToProvider(provider, orderData) {
   try {
-    const response = await axios.post(provider.api_url, {
+    const response = await getHttpClient().post(provider.api_url, {
       key: provider.api_key,
       action: 'add',
       service: orderData.service,
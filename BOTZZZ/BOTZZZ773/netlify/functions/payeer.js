@@ -41,13 +41,17 @@ exports.handler = async (event) => {
   }
 
   try {
+    // Payeer posts form-encoded status callbacks to ?action=webhook; verify
+    // those before attempting to parse the body as JSON.
+    if (event.queryStringParameters?.action === 'webhook') {
+      return await handleWebhook(event, headers);
+    }
+
     const { action, ...data } = JSON.parse(event.body || '{}');
 
     switch (action) {
       case 'create-payment':
         return await handleCreatePayment(event, data, headers);
-      case 'webhook':
-        return await handleWebhook(event, headers);
       case 'check-status':
         return await handleCheckStatus(data, headers);
       default:
@@ -161,6 +165,16 @@ function generatePayeerUrl(orderId, amount, userEmail) {
   return `https://payeer.com/merchant/?${queryString}`;
 }
 
+function isValidSignature(received, expected) {
+  if (!received) {
+    return false;
+  }
+  const receivedBuffer = Buffer.from(received);
+  const expectedBuffer = Buffer.from(expected);
+  return receivedBuffer.length === expectedBuffer.length &&
+    crypto.timingSafeEqual(receivedBuffer, expectedBuffer);
+}
+
 async function handleWebhook(event, headers) {
   try {
     // Parse Payeer webhook data
@@ -183,7 +197,7 @@ async function handleWebhook(event, headers) {
     const signString = `${data.m_operation_id}:${data.m_operation_ps}:${data.m_operation_date}:${data.m_operation_pay_date}:${data.m_shop}:${data.m_orderid}:${data.m_amount}:${data.m_curr}:${data.m_desc}:${data.m_status}:${PAYEER_SECRET_KEY}`;
     const expectedSign = crypto.createHash('sha256').update(signString).digest('hex').toUpperCase();
 
-    if (data.m_sign !== expectedSign) {
+    if (!isValidSignature(data.m_sign, expectedSign)) {
       console.error('Invalid Payeer signature');
       return {
         statusCode: 400,
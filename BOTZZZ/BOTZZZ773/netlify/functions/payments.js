@@ -1,5 +1,5 @@
 // Payments API - Process Payments, Add Balance
-const { supabase, supabaseAdmin } = require('./utils/supabase');
+const { supabaseAdmin } = require('./utils/supabase');
 const jwt = require('jsonwebtoken');
 
 const JWT_SECRET = process.env.JWT_SECRET;
@@ -10,7 +10,7 @@ const STRIPE_WEBHOOK_SECRET = process.env.STRIPE_WEBHOOK_SECRET;
 const requiredEnvVars = ['JWT_SECRET', 'SUPABASE_URL', 'SUPABASE_SERVICE_KEY'];
 requiredEnvVars.forEach(varName => {
   if (!process.env[varName]) {
-    console.error(`❌ Missing required environment variable: ${varName}`);
+    console.error('❌ Missing required environment variable:', varName);
   }
 });
 
@@ -25,7 +25,7 @@ function getStripeClient() {
     const stripe = require('stripe');
     return stripe(key);
   } catch (error) {
-    console.error('Failed to initialize Stripe:', error.message);
+    console.error('Failed to initialize Stripe:', error);
     return null;
   }
 }
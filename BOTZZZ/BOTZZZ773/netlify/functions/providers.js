@@ -1,10 +1,14 @@
 // Providers API - Manage SMM Provider Integrations
-const { supabase, supabaseAdmin } = require('./utils/supabase');
+const { supabaseAdmin } = require('./utils/supabase');
 const jwt = require('jsonwebtoken');
-const axios = require('axios');
 
 const JWT_SECRET = process.env.JWT_SECRET;
 
+// Lazy-load axios; only the test and sync actions call out to providers
+function getHttpClient() {
+  return require('axios');
+}
+
 function getUserFromToken(authHeader) {
   if (!authHeader || !authHeader.startsWith('Bearer ')) {
     return null;
@@ -124,7 +128,7 @@ async function handleAction(data, headers) {
     case 'add':
       return await createProvider(params, headers);
     default:
-      console.error('[ERROR] Invalid action received:', action, 'Normalized:', normalizedAction, 'Full data:', JSON.stringify(data));
+      console.error('[ERROR] Invalid action received:', action, 'Normalized:', normalizedAction, 'Full data:', data);
       return {
         statusCode: 400,
         headers,
@@ -150,7 +154,7 @@ async function testProvider(data, headers) {
     }
 
     // Test connection by fetching balance
-    const response = await axios.post(apiUrl, {
+    const response = await getHttpClient().post(apiUrl, {
       key: apiKey,
       action: 'balance'
     }, {
@@ -216,7 +220,7 @@ async function syncProvider(data, headers) {
     }
 
     // Fetch services from provider
-    const response = await axios.post(provider.api_url, {
+    const response = await getHttpClient().post(provider.api_url, {
       key: provider.api_key,
       action: 'services'
     }, {
@@ -334,7 +338,6 @@ async function createProvider(data, headers) {
 
     if (error) {
       console.error('Create provider error:', error);
-      console.error('Error details:', JSON.stringify(error, null, 2));
       return {
         statusCode: 500,
         headers,
@@ -357,7 +360,6 @@ async function createProvider(data, headers) {
     };
   } catch (error) {
     console.error('Create provider exception:', error);
-    console.error('Exception stack:', error.stack);
     return {
       statusCode: 500,
       headers,
@@ -1,7 +1,6 @@
 // Services API - Get, Create, Update, Delete Services
 const { supabase, supabaseAdmin } = require('./utils/supabase');
 const jwt = require('jsonwebtoken');
-const axios = require('axios');
 
 const JWT_SECRET = process.env.JWT_SECRET;
 
@@ -1,5 +1,5 @@
 // Settings API - Manage Site Settings
-const { supabase, supabaseAdmin } = require('./utils/supabase');
+const { supabaseAdmin } = require('./utils/supabase');
 const jwt = require('jsonwebtoken');
 
 const JWT_SECRET = process.env.JWT_SECRET;
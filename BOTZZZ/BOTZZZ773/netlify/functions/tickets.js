@@ -1,5 +1,5 @@
 // Tickets API - Create, Get, Update, Close Support Tickets
-const { supabase, supabaseAdmin } = require('./utils/supabase');
+const { supabaseAdmin } = require('./utils/supabase');
 const jwt = require('jsonwebtoken');
 
 const JWT_SECRET = process.env.JWT_SECRET;
@@ -4,6 +4,9 @@ const jwt = require('jsonwebtoken');
 
 const JWT_SECRET = process.env.JWT_SECRET;
 
+// Actions only admins may perform
+const ADMIN_ACTIONS = new Set(['list', 'create', 'update-any', 'delete']);
+
 // Helper to verify token and get user
 function getUserFromToken(authHeader) {
   if (!authHeader || !authHeader.startsWith('Bearer ')) {
@@ -94,9 +97,7 @@ exports.handler = async (event) => {
     const bodyData = event.body && event.body.trim() ? JSON.parse(event.body) : {};
     const { action, userId, ...data } = bodyData;
 
-    // Admin-only actions
-    const adminActions = ['list', 'create', 'update-any', 'delete'];
-    if (adminActions.includes(action) && user.role !== 'admin') {
+    if (ADMIN_ACTIONS.has(action) && user.role !== 'admin') {
       return {
         statusCode: 403,
         headers,
@@ -5,10 +5,25 @@ const supabaseUrl = process.env.SUPABASE_URL;
 const supabaseAnonKey = process.env.SUPABASE_ANON_KEY;
 const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY;
 
-// Client for user operations (with RLS)
-const supabase = createClient(supabaseUrl, supabaseAnonKey);
+// Clients are created on first access, so a function only builds the ones
+// it actually destructures from this module
+let supabase = null;
+let supabaseAdmin = null;
 
-// Admin client for bypassing RLS
-const supabaseAdmin = createClient(supabaseUrl, supabaseServiceKey);
+module.exports = {
+  // Client for user operations (with RLS)
+  get supabase() {
+    if (!supabase) {
+      supabase = createClient(supabaseUrl, supabaseAnonKey);
+    }
+    return supabase;
+  },
 
-module.exports = { supabase, supabaseAdmin };
+  // Admin client for bypassing RLS
+  get supabaseAdmin() {
+    if (!supabaseAdmin) {
+      supabaseAdmin = createClient(supabaseUrl, supabaseServiceKey);
+    }
+    return supabaseAdmin;
+  }
+};
@@ -4,7 +4,8 @@
 class APIClientTests {
     constructor() {
         this.results = [];
-        this.api = new APIClient();
+        // Reuse the page's shared client from api-client.js
+        this.api = api;
     }
 
     // Test runner
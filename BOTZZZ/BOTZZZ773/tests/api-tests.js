@@ -2,12 +2,37 @@
 // Run with: node tests/api-tests.js
 
 const assert = require('assert');
+const { ADMIN_LOGIN_BODY, apiCall, printSlowestTests, uniqueSuffix } = require('./test-helpers');
 
-// Test Configuration
-const API_BASE_URL = process.env.API_URL || 'http://localhost:8888/api';
+// Shared test state
 let authToken = null;
 let testUserId = null;
 
+// Static request bodies, serialized once at module load
+const UPDATE_PROFILE_BODY = JSON.stringify({
+  first_name: 'Updated',
+  last_name: 'Name'
+});
+
+const CREATE_TICKET_BODY = JSON.stringify({
+  subject: 'Test Ticket',
+  category: 'other',
+  priority: 'medium',
+  message: 'This is a test ticket message'
+});
+
+const CONTACT_FORM_BODY = JSON.stringify({
+  name: 'Test User',
+  email: 'test@example.com',
+  subject: 'Test Contact',
+  message: 'This is a test contact message'
+});
+
+const CREATE_API_KEY_BODY = JSON.stringify({
+  name: 'Test API Key',
+  permissions: ['read', 'write']
+});
+
 // Color codes for console output
 const colors = {
   reset: '\x1b[0m',
@@ -21,19 +46,23 @@ function log(color, message) {
   console.log(color + message + colors.reset);
 }
 
-// Test helper to make API calls
-async function apiCall(endpoint, options = {}) {
-  const url = `${API_BASE_URL}${endpoint}`;
-  const response = await fetch(url, {
-    ...options,
-    headers: {
-      'Content-Type': 'application/json',
-      ...options.headers
-    }
-  });
-  
-  const data = await response.json();
-  return { status: response.status, data };
+// Builds a test for a GET endpoint that should return 200 and a list field.
+// `label` is lower case ("API keys"); the heading capitalizes each word.
+function listEndpointTest(label, endpoint, field, { auth = true } = {}) {
+  const title = label.replace(/\b\w/g, letter => letter.toUpperCase());
+  return async function() {
+    log(colors.blue, `\n🧪 Testing Get ${title}...`);
+    const result = await apiCall(endpoint, {
+      method: 'GET',
+      headers: auth ? { 'Authorization': `Bearer ${authToken}` } : {}
+    });
+
+    assert.strictEqual(result.status, 200, 'Should return 200 status');
+    assert.ok(Array.isArray(result.data[field]), `Should return ${field} array`);
+
+    log(colors.green, `✓ Get ${label} test passed`);
+    return result.data;
+  };
 }
 
 // Test Suite
@@ -41,12 +70,13 @@ const tests = {
   // Authentication Tests
   async testSignup() {
     log(colors.blue, '\n🧪 Testing Signup...');
+    const suffix = uniqueSuffix();
     const result = await apiCall('/auth', {
       method: 'POST',
       body: JSON.stringify({
         action: 'signup',
-        email: `test${Date.now()}@example.com`,
-        username: `testuser${Date.now()}`,
+        email: `test${suffix}@example.com`,
+        username: `testuser${suffix}`,
         password: 'Test123!@#',
         firstName: 'Test',
         lastName: 'User'
@@ -69,11 +99,7 @@ const tests = {
     log(colors.blue, '\n🧪 Testing Login...');
     const result = await apiCall('/auth', {
       method: 'POST',
-      body: JSON.stringify({
-        action: 'login',
-        email: 'admin@botzzz.com',
-        password: 'admin123'
-      })
+      body: ADMIN_LOGIN_BODY
     });
 
     assert.strictEqual(result.status, 200, 'Should return 200 status');
@@ -128,10 +154,7 @@ const tests = {
       headers: {
         'Authorization': `Bearer ${authToken}`
       },
-      body: JSON.stringify({
-        first_name: 'Updated',
-        last_name: 'Name'
-      })
+      body: UPDATE_PROFILE_BODY
     });
 
     assert.strictEqual(result.status, 200, 'Should return 200 status');
@@ -142,35 +165,10 @@ const tests = {
   },
 
   // Services Tests
-  async testGetServices() {
-    log(colors.blue, '\n🧪 Testing Get Services...');
-    const result = await apiCall('/services', {
-      method: 'GET'
-    });
-
-    assert.strictEqual(result.status, 200, 'Should return 200 status');
-    assert.ok(Array.isArray(result.data.services), 'Should return services array');
-    
-    log(colors.green, '✓ Get services test passed');
-    return result.data;
-  },
+  testGetServices: listEndpointTest('services', '/services', 'services', { auth: false }),
 
   // Orders Tests
-  async testGetOrders() {
-    log(colors.blue, '\n🧪 Testing Get Orders...');
-    const result = await apiCall('/orders', {
-      method: 'GET',
-      headers: {
-        'Authorization': `Bearer ${authToken}`
-      }
-    });
-
-    assert.strictEqual(result.status, 200, 'Should return 200 status');
-    assert.ok(Array.isArray(result.data.orders), 'Should return orders array');
-    
-    log(colors.green, '✓ Get orders test passed');
-    return result.data;
-  },
+  testGetOrders: listEndpointTest('orders', '/orders', 'orders'),
 
   // Tickets Tests
   async testCreateTicket() {
@@ -180,12 +178,7 @@ const tests = {
       headers: {
         'Authorization': `Bearer ${authToken}`
       },
-      body: JSON.stringify({
-        subject: 'Test Ticket',
-        category: 'other',
-        priority: 'medium',
-        message: 'This is a test ticket message'
-      })
+      body: CREATE_TICKET_BODY
     });
 
     assert.strictEqual(result.status, 201, 'Should return 201 status');
@@ -196,33 +189,14 @@ const tests = {
     return result.data;
   },
 
-  async testGetTickets() {
-    log(colors.blue, '\n🧪 Testing Get Tickets...');
-    const result = await apiCall('/tickets', {
-      method: 'GET',
-      headers: {
-        'Authorization': `Bearer ${authToken}`
-      }
-    });
-
-    assert.strictEqual(result.status, 200, 'Should return 200 status');
-    assert.ok(Array.isArray(result.data.tickets), 'Should return tickets array');
-    
-    log(colors.green, '✓ Get tickets test passed');
-    return result.data;
-  },
+  testGetTickets: listEndpointTest('tickets', '/tickets', 'tickets'),
 
   // Contact Form Tests
   async testContactForm() {
     log(colors.blue, '\n🧪 Testing Contact Form...');
     const result = await apiCall('/contact', {
       method: 'POST',
-      body: JSON.stringify({
-        name: 'Test User',
-        email: 'test@example.com',
-        subject: 'Test Contact',
-        message: 'This is a test contact message'
-      })
+      body: CONTACT_FORM_BODY
     });
 
     assert.strictEqual(result.status, 200, 'Should return 200 status');
@@ -257,10 +231,7 @@ const tests = {
       headers: {
         'Authorization': `Bearer ${authToken}`
       },
-      body: JSON.stringify({
-        name: 'Test API Key',
-        permissions: ['read', 'write']
-      })
+      body: CREATE_API_KEY_BODY
     });
 
     assert.strictEqual(result.status, 201, 'Should return 201 status');
@@ -271,21 +242,7 @@ const tests = {
     return result.data;
   },
 
-  async testGetApiKeys() {
-    log(colors.blue, '\n🧪 Testing Get API Keys...');
-    const result = await apiCall('/api-keys', {
-      method: 'GET',
-      headers: {
-        'Authorization': `Bearer ${authToken}`
-      }
-    });
-
-    assert.strictEqual(result.status, 200, 'Should return 200 status');
-    assert.ok(Array.isArray(result.data.keys), 'Should return keys array');
-    
-    log(colors.green, '✓ Get API keys test passed');
-    return result.data;
-  },
+  testGetApiKeys: listEndpointTest('API keys', '/api-keys', 'keys'),
 
   // Error Handling Tests
   async testUnauthorizedAccess() {
@@ -349,9 +306,11 @@ async function runTests() {
     failed: 0,
     total: 0
   };
+  const timings = [];
 
   for (const [testName, testFunc] of Object.entries(tests)) {
     testResults.total++;
+    const started = performance.now();
     try {
       await testFunc();
       testResults.passed++;
@@ -363,6 +322,7 @@ async function runTests() {
         console.log(error.stack);
       }
     }
+    timings.push({ name: testName, ms: performance.now() - started });
   }
 
   // Print Summary
@@ -376,6 +336,7 @@ async function runTests() {
   
   const coverage = ((testResults.passed / testResults.total) * 100).toFixed(2);
   log(colors.blue, `📊 Coverage: ${coverage}%`);
+  printSlowestTests(timings);
   
   if (testResults.failed === 0) {
     log(colors.green, '\n🎉 All tests passed!');
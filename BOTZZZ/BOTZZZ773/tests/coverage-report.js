@@ -19,16 +19,12 @@ class CoverageReporter {
 
   async analyzeFunctions() {
     const functionsDir = path.join(__dirname, '..', 'netlify', 'functions');
-    const files = await fs.readdir(functionsDir);
-
-    for (const file of files) {
-      if (file.endsWith('.js')) {
-        const filePath = path.join(functionsDir, file);
-        const stat = await fs.stat(filePath);
-        
-        if (stat.isFile()) {
-          await this.analyzeFile(filePath, file);
-        }
+    // Dirents carry the file type, so no per-file stat() is needed
+    const entries = await fs.readdir(functionsDir, { withFileTypes: true });
+
+    for (const entry of entries) {
+      if (entry.isFile() && entry.name.endsWith('.js')) {
+        await this.analyzeFile(path.join(functionsDir, entry.name), entry.name);
       }
     }
   }
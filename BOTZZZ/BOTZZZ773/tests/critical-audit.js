@@ -3,6 +3,7 @@
 
 const fs = require('fs').promises;
 const path = require('path');
+const { cachedReadFile } = require('./test-helpers');
 
 const colors = {
   reset: '\x1b[0m',
@@ -104,7 +105,7 @@ class CriticalAudit {
   async auditBusinessLogic() {
     // Check order flow
     const ordersPath = path.join(__dirname, '..', 'netlify', 'functions', 'orders.js');
-    const ordersCode = await fs.readFile(ordersPath, 'utf-8');
+    const ordersCode = await cachedReadFile(ordersPath);
 
     // Balance deduction
     if (ordersCode.includes('user.balance - totalCost') || ordersCode.includes('balance >= totalCost')) {
@@ -149,7 +150,7 @@ class CriticalAudit {
 
   async auditPayments() {
     const paymentsPath = path.join(__dirname, '..', 'netlify', 'functions', 'payments.js');
-    const paymentsCode = await fs.readFile(paymentsPath, 'utf-8');
+    const paymentsCode = await cachedReadFile(paymentsPath);
 
     // Stripe webhook verification
     if (paymentsCode.includes('stripe.webhooks.constructEvent')) {
@@ -186,7 +187,7 @@ class CriticalAudit {
 
     // Check Payeer
     const payeerPath = path.join(__dirname, '..', 'netlify', 'functions', 'payeer.js');
-    const payeerCode = await fs.readFile(payeerPath, 'utf-8');
+    const payeerCode = await cachedReadFile(payeerPath);
 
     if (payeerCode.includes('createHash') && payeerCode.includes('sha256')) {
       this.pass('Payeer signature verification implemented');
@@ -200,7 +201,7 @@ class CriticalAudit {
 
     // Check .env for payment keys
     const envPath = path.join(__dirname, '..', '.env');
-    const envContent = await fs.readFile(envPath, 'utf-8');
+    const envContent = await cachedReadFile(envPath);
 
     if (!envContent.includes('STRIPE_SECRET_KEY=sk_') && !envContent.includes('your_stripe_secret_key')) {
       this.blocker(
@@ -221,7 +222,7 @@ class CriticalAudit {
 
   async auditProviderIntegration() {
     const ordersPath = path.join(__dirname, '..', 'netlify', 'functions', 'orders.js');
-    const ordersCode = await fs.readFile(ordersPath, 'utf-8');
+    const ordersCode = await cachedReadFile(ordersPath);
 
     // Provider API call
     if (ordersCode.includes('provider.api_url') && ordersCode.includes('axios')) {
@@ -258,7 +259,7 @@ class CriticalAudit {
 
     // Check if any providers exist
     const providersPath = path.join(__dirname, '..', 'netlify', 'functions', 'providers.js');
-    const providersCode = await fs.readFile(providersPath, 'utf-8');
+    const providersCode = await cachedReadFile(providersPath);
 
     if (providersCode.includes('api_url') && providersCode.includes('api_key')) {
       this.pass('Provider management system ready');
@@ -276,7 +277,7 @@ class CriticalAudit {
 
   async auditSecurity() {
     const authPath = path.join(__dirname, '..', 'netlify', 'functions', 'auth.js');
-    const authCode = await fs.readFile(authPath, 'utf-8');
+    const authCode = await cachedReadFile(authPath);
 
     // Password hashing
     if (authCode.includes('bcrypt.hash') || authCode.includes('bcrypt.compare')) {
@@ -294,7 +295,7 @@ class CriticalAudit {
 
     // JWT secret strength
     const envPath = path.join(__dirname, '..', '.env');
-    const envContent = await fs.readFile(envPath, 'utf-8');
+    const envContent = await cachedReadFile(envPath);
     const jwtMatch = envContent.match(/JWT_SECRET=(.+)/);
     
     if (jwtMatch && jwtMatch[1].length < 32) {
@@ -309,7 +310,7 @@ class CriticalAudit {
 
     // Admin role protection
     const usersPath = path.join(__dirname, '..', 'netlify', 'functions', 'users.js');
-    const usersCode = await fs.readFile(usersPath, 'utf-8');
+    const usersCode = await cachedReadFile(usersPath);
 
     if (usersCode.includes('role') && usersCode.includes('admin')) {
       this.pass('Admin role checks implemented');
@@ -334,7 +335,7 @@ class CriticalAudit {
 
   async auditDatabase() {
     const schemaPath = path.join(__dirname, '..', 'supabase', 'schema.sql');
-    const schema = await fs.readFile(schemaPath, 'utf-8');
+    const schema = await cachedReadFile(schemaPath);
 
     // Critical tables
     const requiredTables = [
@@ -392,7 +393,7 @@ class CriticalAudit {
     
     for (const func of functions) {
       const funcPath = path.join(__dirname, '..', 'netlify', 'functions', func);
-      const code = await fs.readFile(funcPath, 'utf-8');
+      const code = await cachedReadFile(funcPath);
 
       if (!code.includes('try') || !code.includes('catch')) {
         this.blocker(
@@ -419,7 +420,7 @@ class CriticalAudit {
     // Check API client
     const apiClientPath = path.join(__dirname, '..', 'js', 'api-client.js');
     try {
-      const apiCode = await fs.readFile(apiClientPath, 'utf-8');
+      const apiCode = await cachedReadFile(apiClientPath);
       
       if (apiCode.includes('Authorization') && apiCode.includes('Bearer')) {
         this.pass('Auth headers configured in API client');
@@ -451,7 +452,7 @@ class CriticalAudit {
     // Check auth integration
     const authBackendPath = path.join(__dirname, '..', 'js', 'auth-backend.js');
     try {
-      const authBackCode = await fs.readFile(authBackendPath, 'utf-8');
+      const authBackCode = await cachedReadFile(authBackendPath);
       if (authBackCode.includes('localStorage') && authBackCode.includes('token')) {
         this.pass('Token storage configured');
       }
@@ -467,7 +468,7 @@ class CriticalAudit {
   async auditPerformance() {
     // Check for N+1 queries
     const ordersPath = path.join(__dirname, '..', 'netlify', 'functions', 'orders.js');
-    const ordersCode = await fs.readFile(ordersPath, 'utf-8');
+    const ordersCode = await cachedReadFile(ordersPath);
 
     if (ordersCode.includes('.select(') && ordersCode.includes('*')) {
       this.warning('Selecting all columns', 'Consider selecting only needed fields for performance');
@@ -490,7 +491,7 @@ class CriticalAudit {
 
   async auditValidation() {
     const authPath = path.join(__dirname, '..', 'netlify', 'functions', 'auth.js');
-    const authCode = await fs.readFile(authPath, 'utf-8');
+    const authCode = await cachedReadFile(authPath);
 
     // Email validation
     if (authCode.includes('@') || authCode.includes('email')) {
@@ -516,7 +517,7 @@ class CriticalAudit {
 
     // Order validation
     const ordersPath = path.join(__dirname, '..', 'netlify', 'functions', 'orders.js');
-    const ordersCode = await fs.readFile(ordersPath, 'utf-8');
+    const ordersCode = await cachedReadFile(ordersPath);
 
     if (ordersCode.includes('quantity') && (ordersCode.includes('> 0') || ordersCode.includes('< 0'))) {
       this.pass('Order quantity validation');
@@ -562,7 +563,7 @@ class CriticalAudit {
 
     // Check providers management
     const providersPath = path.join(__dirname, '..', 'netlify', 'functions', 'providers.js');
-    const providersCode = await fs.readFile(providersPath, 'utf-8');
+    const providersCode = await cachedReadFile(providersPath);
 
     if (providersCode.includes('POST') && providersCode.includes('DELETE')) {
       this.pass('Provider CRUD operations implemented');
@@ -3,6 +3,7 @@
 
 const fs = require('fs').promises;
 const path = require('path');
+const { cachedReadFile } = require('./test-helpers');
 
 const colors = {
   reset: '\x1b[0m',
@@ -28,6 +29,11 @@ class DiagnosticRunner {
     };
   }
 
+  // Read a file relative to the workspace root
+  readWorkspaceFile(...segments) {
+    return cachedReadFile(path.join(__dirname, '..', ...segments));
+  }
+
   async check(name, testFunc) {
     this.results.total++;
     try {
@@ -137,8 +143,7 @@ class DiagnosticRunner {
   async checkConfiguration() {
     // Check netlify.toml
     await this.check('netlify.toml is configured', async () => {
-      const configPath = path.join(__dirname, '..', 'netlify.toml');
-      const content = await fs.readFile(configPath, 'utf-8');
+      const content = await this.readWorkspaceFile('netlify.toml');
       if (!content.includes('functions = "netlify/functions"')) {
         throw new Error('Functions directory not configured');
       }
@@ -149,8 +154,7 @@ class DiagnosticRunner {
 
     // Check package.json
     await this.check('package.json has required scripts', async () => {
-      const pkgPath = path.join(__dirname, '..', 'package.json');
-      const content = await fs.readFile(pkgPath, 'utf-8');
+      const content = await this.readWorkspaceFile('package.json');
       const pkg = JSON.parse(content);
       
       if (!pkg.scripts.dev) throw new Error('Missing dev script');
@@ -160,8 +164,7 @@ class DiagnosticRunner {
 
     // Check .env structure
     await this.check('.env file structure', async () => {
-      const envPath = path.join(__dirname, '..', '.env');
-      const content = await fs.readFile(envPath, 'utf-8');
+      const content = await this.readWorkspaceFile('.env');
       
       const requiredVars = [
         'SUPABASE_URL',
@@ -170,10 +173,9 @@ class DiagnosticRunner {
         'JWT_SECRET'
       ];
 
-      for (const varName of requiredVars) {
-        if (!content.includes(varName)) {
-          throw new Error(`Missing ${varName}`);
-        }
+      const missing = requiredVars.filter(varName => !content.includes(varName));
+      if (missing.length > 0) {
+        throw new Error(`Missing ${missing.join(', ')}`);
       }
     });
   }
@@ -253,8 +255,7 @@ class DiagnosticRunner {
   }
 
   async checkEnvironmentVariables() {
-    const envPath = path.join(__dirname, '..', '.env');
-    const content = await fs.readFile(envPath, 'utf-8');
+    const content = await this.readWorkspaceFile('.env');
 
     // Check each variable has a value
     await this.check('SUPABASE_URL is set', async () => {
@@ -302,8 +303,7 @@ class DiagnosticRunner {
   }
 
   async checkDependencies() {
-    const pkgPath = path.join(__dirname, '..', 'package.json');
-    const content = await fs.readFile(pkgPath, 'utf-8');
+    const content = await this.readWorkspaceFile('package.json');
     const pkg = JSON.parse(content);
 
     const requiredDeps = [
@@ -359,8 +359,7 @@ class DiagnosticRunner {
   async checkSecurity() {
     // Check auth.js has password hashing
     await this.check('Password hashing implemented', async () => {
-      const authPath = path.join(__dirname, '..', 'netlify', 'functions', 'auth.js');
-      const content = await fs.readFile(authPath, 'utf-8');
+      const content = await this.readWorkspaceFile('netlify', 'functions', 'auth.js');
       
       if (!content.includes('bcrypt')) {
         throw new Error('bcrypt not used for password hashing');
@@ -369,8 +368,7 @@ class DiagnosticRunner {
 
     // Check JWT implementation
     await this.check('JWT authentication implemented', async () => {
-      const authPath = path.join(__dirname, '..', 'netlify', 'functions', 'auth.js');
-      const content = await fs.readFile(authPath, 'utf-8');
+      const content = await this.readWorkspaceFile('netlify', 'functions', 'auth.js');
       
       if (!content.includes('jsonwebtoken') && !content.includes('jwt')) {
         throw new Error('JWT not implemented');
@@ -379,8 +377,7 @@ class DiagnosticRunner {
 
     // Check CORS is configured
     await this.check('CORS configured', async () => {
-      const configPath = path.join(__dirname, '..', 'netlify.toml');
-      const content = await fs.readFile(configPath, 'utf-8');
+      const content = await this.readWorkspaceFile('netlify.toml');
       
       if (!content.includes('Access-Control-Allow-Origin') && !content.includes('cors')) {
         return 'warning'; // CORS might be configured differently
@@ -404,14 +401,12 @@ class DiagnosticRunner {
 
   async checkDatabaseSchema() {
     await this.check('Database schema file exists', async () => {
-      const schemaPath = path.join(__dirname, '..', 'supabase', 'schema.sql');
-      await fs.access(schemaPath);
+      await this.readWorkspaceFile('supabase', 'schema.sql');
     });
 
     await this.check('Schema has required tables', async () => {
-      const schemaPath = path.join(__dirname, '..', 'supabase', 'schema.sql');
-      const content = await fs.readFile(schemaPath, 'utf-8');
-      
+      const content = await this.readWorkspaceFile('supabase', 'schema.sql');
+
       const requiredTables = [
         'users',
         'services',
@@ -424,17 +419,21 @@ class DiagnosticRunner {
         'settings'
       ];
 
+      // Collect every defined table in one pass over the file
+      const definedTables = new Set(
+        Array.from(content.matchAll(/create table (\w+)/gi), match => match[1])
+      );
+
       for (const table of requiredTables) {
-        if (!content.includes(`CREATE TABLE ${table}`) && !content.includes(`create table ${table}`)) {
+        if (!definedTables.has(table)) {
           throw new Error(`Table ${table} not defined`);
         }
       }
     });
 
     await this.check('RLS policies defined', async () => {
-      const schemaPath = path.join(__dirname, '..', 'supabase', 'schema.sql');
-      const content = await fs.readFile(schemaPath, 'utf-8');
-      
+      const content = await this.readWorkspaceFile('supabase', 'schema.sql');
+
       if (!content.includes('ALTER TABLE') || !content.includes('ENABLE ROW LEVEL SECURITY')) {
         return 'warning';
       }
@@ -2,8 +2,8 @@
 // Tests complete user workflows and API integrations
 
 const assert = require('assert');
+const { apiCall, getAdminToken, printSlowestTests, uniqueSuffix } = require('./test-helpers');
 
-const API_BASE_URL = process.env.API_URL || 'http://localhost:8888/api';
 let testData = {
   adminToken: null,
   userToken: null,
@@ -14,6 +14,26 @@ let testData = {
   apiKey: null
 };
 
+// Static request bodies, serialized once at module load
+const CREATE_TICKET_BODY = JSON.stringify({
+  subject: 'Integration Test Ticket',
+  category: 'other',
+  priority: 'medium',
+  message: 'This is an integration test ticket'
+});
+
+const CREATE_API_KEY_BODY = JSON.stringify({
+  name: 'Integration Test Key',
+  permissions: ['read', 'write']
+});
+
+const CONTACT_FORM_BODY = JSON.stringify({
+  name: 'Integration Tester',
+  email: 'integration@test.com',
+  subject: 'Test Contact',
+  message: 'This is a test contact form submission'
+});
+
 const colors = {
   reset: '\x1b[0m',
   green: '\x1b[32m',
@@ -26,29 +46,15 @@ function log(color, message) {
   console.log(color + message + colors.reset);
 }
 
-async function apiCall(endpoint, options = {}) {
-  const url = `${API_BASE_URL}${endpoint}`;
-  const response = await fetch(url, {
-    ...options,
-    headers: {
-      'Content-Type': 'application/json',
-      ...options.headers
-    }
-  });
-  
-  const data = await response.json();
-  return { status: response.status, data };
-}
-
 // Integration Test Scenarios
 const integrationTests = {
   // Complete User Registration Flow
   async testCompleteUserRegistration() {
     log(colors.blue, '\n🧪 Testing Complete User Registration Flow...');
     
-    const timestamp = Date.now();
-    const email = `testuser${timestamp}@example.com`;
-    const username = `testuser${timestamp}`;
+    const suffix = uniqueSuffix();
+    const email = `testuser${suffix}@example.com`;
+    const username = `testuser${suffix}`;
     
     // 1. Sign up
     const signupResult = await apiCall('/auth', {
@@ -97,17 +103,8 @@ const integrationTests = {
   async testCompleteOrderLifecycle() {
     log(colors.blue, '\n🧪 Testing Complete Order Lifecycle...');
     
-    // Login as admin first to add balance
-    const loginResult = await apiCall('/auth', {
-      method: 'POST',
-      body: JSON.stringify({
-        action: 'login',
-        email: 'admin@botzzz.com',
-        password: 'admin123'
-      })
-    });
-    
-    testData.adminToken = loginResult.data.token;
+    // Log in as admin so balance can be added
+    testData.adminToken = await getAdminToken();
     
     // 1. Get services
     const servicesResult = await apiCall('/services', {
@@ -217,12 +214,7 @@ const integrationTests = {
       headers: {
         'Authorization': `Bearer ${testData.userToken}`
       },
-      body: JSON.stringify({
-        subject: 'Integration Test Ticket',
-        category: 'other',
-        priority: 'medium',
-        message: 'This is an integration test ticket'
-      })
+      body: CREATE_TICKET_BODY
     });
     
     assert.strictEqual(createResult.status, 201, 'Should create ticket');
@@ -279,10 +271,7 @@ const integrationTests = {
       headers: {
         'Authorization': `Bearer ${testData.userToken}`
       },
-      body: JSON.stringify({
-        name: 'Integration Test Key',
-        permissions: ['read', 'write']
-      })
+      body: CREATE_API_KEY_BODY
     });
     
     assert.strictEqual(createResult.status, 201, 'Should create API key');
@@ -321,12 +310,7 @@ const integrationTests = {
     
     const contactResult = await apiCall('/contact', {
       method: 'POST',
-      body: JSON.stringify({
-        name: 'Integration Tester',
-        email: 'integration@test.com',
-        subject: 'Test Contact',
-        message: 'This is a test contact form submission'
-      })
+      body: CONTACT_FORM_BODY
     });
     
     assert.strictEqual(contactResult.status, 200, 'Should submit contact form');
@@ -339,28 +323,23 @@ const integrationTests = {
   async testDashboardStats() {
     log(colors.blue, '\n🧪 Testing Dashboard Statistics...');
     
-    // User stats
-    const userStatsResult = await apiCall('/dashboard', {
+    // The same read-only GET as user and as admin, sent concurrently
+    const roles = [
+      { role: 'user', token: testData.userToken },
+      { role: 'admin', token: testData.adminToken }
+    ];
+    const results = await Promise.all(roles.map(({ token }) => apiCall('/dashboard', {
       method: 'GET',
       headers: {
-        'Authorization': `Bearer ${testData.userToken}`
+        'Authorization': `Bearer ${token}`
       }
-    });
+    })));
     
-    assert.strictEqual(userStatsResult.status, 200, 'Should get user stats');
-    assert.ok(userStatsResult.data.stats, 'Should return stats');
-    
-    // Admin stats
-    const adminStatsResult = await apiCall('/dashboard', {
-      method: 'GET',
-      headers: {
-        'Authorization': `Bearer ${testData.adminToken}`
-      }
+    results.forEach((result, i) => {
+      assert.strictEqual(result.status, 200, `Should get ${roles[i].role} stats`);
+      assert.ok(result.data.stats, `Should return ${roles[i].role} stats`);
     });
     
-    assert.strictEqual(adminStatsResult.status, 200, 'Should get admin stats');
-    assert.ok(adminStatsResult.data.stats, 'Should return admin stats');
-    
     log(colors.green, '✓ Dashboard statistics passed');
   }
 };
@@ -376,9 +355,11 @@ async function runIntegrationTests() {
     failed: 0,
     total: 0
   };
+  const timings = [];
 
   for (const [testName, testFunc] of Object.entries(integrationTests)) {
     results.total++;
+    const started = performance.now();
     try {
       await testFunc();
       results.passed++;
@@ -390,6 +371,7 @@ async function runIntegrationTests() {
         console.log(error.stack);
       }
     }
+    timings.push({ name: testName, ms: performance.now() - started });
   }
 
   // Print Summary
@@ -403,6 +385,7 @@ async function runIntegrationTests() {
   
   const coverage = ((results.passed / results.total) * 100).toFixed(2);
   log(colors.blue, `📊 Coverage: ${coverage}%`);
+  printSlowestTests(timings);
   
   if (results.failed === 0) {
     log(colors.green, '\n🎉 All integration tests passed!');
@@ -2,8 +2,15 @@
 // Run with: node tests/run-all-tests.js
 
 const { spawn } = require('child_process');
+const os = require('os');
 const path = require('path');
 
+// Maximum number of suites running at once (at least one)
+const TEST_CONCURRENCY = Math.max(
+  1,
+  parseInt(process.env.TEST_CONCURRENCY, 10) || os.availableParallelism()
+);
+
 const colors = {
   reset: '\x1b[0m',
   green: '\x1b[32m',
@@ -24,51 +31,78 @@ class TestRunner {
       totalTests: 0,
       passedTests: 0,
       failedTests: 0,
-      startTime: Date.now()
+      startTime: performance.now()
     };
   }
 
-  async runTestSuite(name, scriptPath) {
-    log('magenta', `\n${'='.repeat(60)}`);
-    log('magenta', `Running ${name}...`);
-    log('magenta', '='.repeat(60));
-
+  // Suites run in separate processes at the same time, so each one's output
+  // is buffered and printed as a block once that suite finishes.
+  runTestSuite(name, scriptPath, env) {
     return new Promise((resolve) => {
+      const output = [];
       const testProcess = spawn('node', [scriptPath], {
-        stdio: 'inherit',
-        cwd: path.dirname(scriptPath)
+        stdio: ['ignore', 'pipe', 'pipe'],
+        cwd: path.dirname(scriptPath),
+        env
       });
 
+      testProcess.stdout.on('data', (chunk) => output.push(chunk));
+      testProcess.stderr.on('data', (chunk) => output.push(chunk));
+
+      const printOutput = () => {
+        log('magenta', `\n${'='.repeat(60)}`);
+        log('magenta', `${name}`);
+        log('magenta', '='.repeat(60));
+        process.stdout.write(Buffer.concat(output));
+      };
+
       testProcess.on('close', (code) => {
-        const result = {
-          name,
-          passed: code === 0,
-          exitCode: code
-        };
-        
-        this.results.suites.push(result);
-        
+        printOutput();
+
         if (code === 0) {
           log('green', `✓ ${name} completed successfully`);
         } else {
           log('red', `✗ ${name} failed with exit code ${code}`);
         }
-        
-        resolve(result);
+
+        resolve({
+          name,
+          passed: code === 0,
+          exitCode: code
+        });
       });
 
       testProcess.on('error', (error) => {
         log('red', `Error running ${name}: ${error.message}`);
-        this.results.suites.push({
-          name,
-          passed: false,
-          error: error.message
-        });
         resolve({ name, passed: false, error: error.message });
       });
     });
   }
 
+  // Run suites through a pool of at most TEST_CONCURRENCY processes. Each
+  // suite gets its own TEST_WORKER_ID so the data it creates can't collide
+  // with a suite running alongside it. Results keep the suite order.
+  async runSuites(testSuites) {
+    const results = new Array(testSuites.length);
+    let next = 0;
+
+    const worker = async () => {
+      while (next < testSuites.length) {
+        const index = next++;
+        const suite = testSuites[index];
+        results[index] = await this.runTestSuite(suite.name, suite.path, {
+          ...process.env,
+          TEST_WORKER_ID: String(index)
+        });
+      }
+    };
+
+    const poolSize = Math.min(TEST_CONCURRENCY, testSuites.length);
+    log('blue', `Running ${testSuites.length} suites, up to ${poolSize} at a time...`);
+    await Promise.all(Array.from({ length: poolSize }, worker));
+    return results;
+  }
+
   async runAll() {
     log('yellow', '\n╔════════════════════════════════════════════════════════╗');
     log('yellow', '║        BOTZZZ Comprehensive Test Suite Runner         ║');
@@ -85,14 +119,16 @@ class TestRunner {
       }
     ];
 
-    // Run each test suite
-    for (const suite of testSuites) {
-      try {
-        await this.runTestSuite(suite.name, suite.path);
-      } catch (error) {
-        log('red', `Failed to run ${suite.name}: ${error.message}`);
-      }
-    }
+    // Suites are independent processes, so run them in parallel
+    const results = await this.runSuites(testSuites);
+
+    // A suite with no result never ran; count it as failed so an empty run
+    // can't exit 0
+    this.results.suites = testSuites.map((suite, index) => results[index] || {
+      name: suite.name,
+      passed: false,
+      error: 'Suite did not run'
+    });
 
     // Print final summary
     this.printSummary();
@@ -103,7 +139,7 @@ class TestRunner {
   }
 
   printSummary() {
-    const duration = ((Date.now() - this.results.startTime) / 1000).toFixed(2);
+    const duration = ((performance.now() - this.results.startTime) / 1000).toFixed(2);
     
     log('yellow', '\n╔════════════════════════════════════════════════════════╗');
     log('yellow', '║              Final Test Results Summary                ║');
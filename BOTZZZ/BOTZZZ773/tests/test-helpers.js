@@ -0,0 +1,84 @@
+// Shared Test Helpers
+// API access and helpers shared by the test suites
+
+const fs = require('fs').promises;
+
+const API_BASE_URL = process.env.API_URL || 'http://localhost:8888/api';
+
+const ADMIN_EMAIL = 'admin@botzzz.com';
+const ADMIN_PASSWORD = 'admin123';
+const ADMIN_LOGIN_BODY = JSON.stringify({
+  action: 'login',
+  email: ADMIN_EMAIL,
+  password: ADMIN_PASSWORD
+});
+
+const fileCache = new Map();
+
+// Slowest-test report: how many to show and the minimum duration to list
+const DURATIONS_LIMIT = parseInt(process.env.TEST_DURATIONS, 10) || 25;
+const DURATIONS_MIN_MS = 100;
+
+async function apiCall(endpoint, options = {}) {
+  const url = `${API_BASE_URL}${endpoint}`;
+  const response = await fetch(url, {
+    ...options,
+    headers: {
+      'Content-Type': 'application/json',
+      ...options.headers
+    }
+  });
+
+  const data = await response.json();
+  return { status: response.status, data };
+}
+
+// Log in as admin and return the token, or null if the login failed
+async function getAdminToken() {
+  const result = await apiCall('/auth', {
+    method: 'POST',
+    body: ADMIN_LOGIN_BODY
+  });
+  return result.data.token || null;
+}
+
+// Suffix for signup emails and usernames. The worker id set by the runner
+// keeps parallel suites apart when they sign up in the same millisecond.
+function uniqueSuffix() {
+  return `${Date.now()}${process.env.TEST_WORKER_ID || ''}`;
+}
+
+// Read a UTF-8 file at most once per process. The diagnostic and audit
+// scripts inspect the same sources from many checks.
+function cachedReadFile(filePath) {
+  if (!fileCache.has(filePath)) {
+    fileCache.set(filePath, fs.readFile(filePath, 'utf-8'));
+  }
+  return fileCache.get(filePath);
+}
+
+// Print the slowest tests so optimization effort lands where the time goes
+function printSlowestTests(timings, limit = DURATIONS_LIMIT) {
+  const slowest = timings
+    .filter(timing => timing.ms >= DURATIONS_MIN_MS)
+    .sort((a, b) => b.ms - a.ms)
+    .slice(0, limit);
+
+  if (slowest.length === 0) {
+    return;
+  }
+
+  console.log(`\n⏱️  Slowest ${slowest.length} tests:`);
+  slowest.forEach(({ name, ms }) => {
+    console.log(`   ${(ms / 1000).toFixed(2)}s  ${name}`);
+  });
+}
+
+module.exports = {
+  ADMIN_LOGIN_BODY,
+  apiCall,
+  cachedReadFile,
+  getAdminToken,
+  printSlowestTests,
+  uniqueSuffix
+};